@@ -1,9 +1,17 @@
 """Authentication router for user registration and login."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
 from app.services.userService import UserService
-from app.schemas.user import UserRegisterRequest, UserLoginRequest, TokenResponse, UserResponse
+from app.schemas.user import (
+    UserRegisterRequest,
+    UserLoginRequest,
+    TokenResponse,
+    UserResponse,
+    token_response_adapter,
+)
+from app.core.config import settings
+from app.core.responses import json_response
 from app.core.security import TokenUtil
 import uuid
 
@@ -28,6 +36,9 @@ async def register(
     try:
         service = UserService(session)
         user, tokens = await service.register_user(request)
+        if settings.fast_json_responses:
+            # Tokens are already a validated TokenResponse; skip re-validation
+            return json_response(token_response_adapter, tokens, status.HTTP_201_CREATED)
         return tokens
     except ValueError as e:
         raise HTTPException(
@@ -39,6 +50,7 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     request: UserLoginRequest,
+    http_request: Request,
     session: AsyncSession = Depends(get_db),
 ):
     """
@@ -49,11 +61,19 @@ async def login(
     2. Verify password against hashed password
     3. Check if user account is active
     4. Generate JWT access and refresh tokens
-    5. Return tokens for authenticated requests
+    5. Queue login activity (last_login_at + audit trail) for batched write
+    6. Return tokens for authenticated requests
     """
     try:
         service = UserService(session)
-        user, tokens = await service.login_user(request)
+        user, tokens = await service.login_user(
+            request,
+            ip_address=http_request.client.host if http_request.client else None,
+            user_agent=http_request.headers.get("user-agent"),
+        )
+        if settings.fast_json_responses:
+            # Tokens are already a validated TokenResponse; skip re-validation
+            return json_response(token_response_adapter, tokens)
         return tokens
     except ValueError as e:
         raise HTTPException(
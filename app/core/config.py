@@ -21,9 +21,17 @@ class Settings(BaseSettings):
     service_name: str = "Identity Service"
     service_version: str = "1.0.0"
     debug: bool = False
+    # Serve JSON via orjson and return pre-serialized auth responses
+    fast_json_responses: bool = False
     
     # Security
     password_min_length: int = 8
+
+    # Login Activity (write-behind audit trail)
+    login_activity_queue_size: int = 10000
+    login_activity_batch_size: int = 500
+    login_activity_flush_interval_seconds: float = 1.0
+    login_activity_shutdown_timeout_seconds: float = 10.0
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,36 @@
+"""Fast JSON response helpers for the opt-in fast response mode."""
+from typing import Any
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, falling back to pydantic-core."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        if orjson is not None:
+            return orjson.dumps(content)
+        return to_json(content)
+
+
+def json_response(adapter: TypeAdapter, value: Any, status_code: int = 200) -> Response:
+    """
+    Build a response from pre-serialized JSON bytes.
+
+    FastAPI passes returned Response objects through untouched, so this
+    skips the second response_model validation and jsonable_encoder pass.
+    The value must already be valid for the adapter's type.
+    """
+    return Response(
+        content=adapter.dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,14 +1,31 @@
 """Main FastAPI application."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routers import api_router
 from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.services.loginActivityWriter import login_activity_writer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers on startup and flush them on shutdown."""
+    await login_activity_writer.start()
+    try:
+        yield
+    finally:
+        await login_activity_writer.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.service_name,
     version=settings.service_version,
     description="Identity Service - User authentication and management",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if settings.fast_json_responses else JSONResponse,
 )
 
 # CORS middleware configuration
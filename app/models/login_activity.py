@@ -0,0 +1,26 @@
+"""Login activity model for SQLAlchemy ORM."""
+import uuid
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from app.db.base import Base
+
+
+class LoginActivity(Base):
+    """Audit record of a single successful login."""
+
+    __tablename__ = "login_activity"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    logged_in_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    ip_address = Column(String(45), nullable=True)
+    user_agent = Column(String(255), nullable=True)
+
+    def __repr__(self):
+        return f"<LoginActivity(id={self.id}, user_id={self.user_id}, logged_in_at={self.logged_in_at})>"
@@ -0,0 +1,89 @@
+"""Login activity repository for batched database writes."""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, update, values, column, or_, DateTime, String
+from sqlalchemy.dialects.postgresql import UUID
+from app.models.login_activity import LoginActivity
+from app.models.user import User
+from datetime import datetime
+from typing import Dict, List
+import uuid
+
+# asyncpg rejects statements with more bind parameters than this.
+MAX_BIND_PARAMS = 32767
+
+
+def _chunks(rows: List, params_per_row: int) -> List[List]:
+    """Split rows so each statement stays under MAX_BIND_PARAMS."""
+    size = MAX_BIND_PARAMS // params_per_row
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+
+class LoginActivityRepository:
+    """Repository for login activity and last-login bookkeeping."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def insert_login_events(self, events: List[Dict]) -> None:
+        """
+        Insert login audit rows with multi-row ``INSERT ... SELECT``.
+
+        Rows are joined against ``users`` so events for users deleted
+        since they logged in are skipped instead of failing the batch on
+        the foreign key.
+        """
+        rows = [
+            (e["user_id"], e["logged_in_at"], e["ip_address"], e["user_agent"])
+            for e in events
+        ]
+        for chunk in _chunks(rows, params_per_row=4):
+            batch = values(
+                column("user_id", UUID(as_uuid=True)),
+                column("logged_in_at", DateTime),
+                column("ip_address", String),
+                column("user_agent", String),
+                name="batch",
+            ).data(chunk)
+            await self.session.execute(
+                insert(LoginActivity).from_select(
+                    ["user_id", "logged_in_at", "ip_address", "user_agent"],
+                    select(
+                        batch.c.user_id,
+                        batch.c.logged_in_at,
+                        batch.c.ip_address,
+                        batch.c.user_agent,
+                    ).join(User, User.id == batch.c.user_id),
+                    include_defaults=False,
+                )
+            )
+
+    async def update_last_login(self, last_logins: Dict[uuid.UUID, datetime]) -> None:
+        """
+        Update users.last_login_at for many users in one statement.
+
+        Emits ``UPDATE users ... FROM (VALUES ...)`` and never moves a
+        timestamp backwards. ``updated_at`` is left untouched since a login
+        is not a profile change.
+        """
+        for chunk in _chunks(list(last_logins.items()), params_per_row=2):
+            batch = values(
+                column("id", UUID(as_uuid=True)),
+                column("last_login_at", DateTime),
+                name="batch",
+            ).data(chunk)
+            await self.session.execute(
+                update(User)
+                .where(User.id == batch.c.id)
+                .where(
+                    or_(
+                        User.last_login_at.is_(None),
+                        User.last_login_at < batch.c.last_login_at,
+                    )
+                )
+                .values(
+                    last_login_at=batch.c.last_login_at,
+                    updated_at=User.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
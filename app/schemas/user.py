@@ -1,5 +1,5 @@
 """Pydantic schemas for request/response validation."""
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -80,3 +80,8 @@ class HealthCheckResponse(BaseModel):
     service: str = Field(..., description="Service name")
     version: str = Field(..., description="Service version")
     timestamp: datetime = Field(..., description="Check timestamp")
+
+
+# Cached adapter for pre-serialized token responses; building a TypeAdapter
+# compiles a core schema, so do it once.
+token_response_adapter = TypeAdapter(TokenResponse)
@@ -0,0 +1,200 @@
+"""Write-behind pipeline for login activity and last-login tracking."""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+import uuid
+from app.core.config import settings
+from app.db.database import async_session
+from app.repositories.loginActivityRepository import LoginActivityRepository
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop() to tell the worker to flush what it has and exit.
+_STOP = object()
+
+
+class LoginActivityWriter:
+    """
+    Buffer login events in memory and persist them in batches.
+
+    The login path only pays for a ``put_nowait`` on a bounded queue. A
+    background task drains the queue and flushes whenever ``batch_size``
+    events are pending or ``flush_interval`` seconds have passed since the
+    first event of the batch. When the queue is full new events are dropped
+    and counted rather than blocking the request.
+    """
+
+    def __init__(
+        self,
+        session_factory=async_session,
+        max_queue_size: int = settings.login_activity_queue_size,
+        batch_size: int = settings.login_activity_batch_size,
+        flush_interval: float = settings.login_activity_flush_interval_seconds,
+        shutdown_timeout: float = settings.login_activity_shutdown_timeout_seconds,
+    ):
+        """Initialize writer; call start() from within the event loop."""
+        self.session_factory = session_factory
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._accepting = False
+        self._dropped_reported = 0
+        # Events taken off the queue but not yet persisted
+        self._in_flight: List[Dict] = []
+
+    async def start(self) -> None:
+        """Create the queue and launch the background flush task."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+        self._accepting = True
+
+    async def stop(self) -> None:
+        """
+        Stop accepting events and flush everything still queued.
+
+        Enqueueing the stop marker and draining both count against
+        ``shutdown_timeout``; past it the worker is cancelled and whatever
+        was queued or mid-flush is reported as lost.
+        """
+        if self._task is None:
+            return
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._drain(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            lost = len(self._in_flight)
+            while not self._queue.empty():
+                if self._queue.get_nowait() is not _STOP:
+                    lost += 1
+            self.failed += lost
+            logger.error(
+                "Login activity writer did not drain within %.1fs; %d events lost",
+                self.shutdown_timeout,
+                lost,
+            )
+        self._task = None
+        self._queue = None
+        self._in_flight = []
+
+    async def _drain(self) -> None:
+        """Queue the stop marker and wait for the worker to finish."""
+        await self._queue.put(_STOP)
+        await asyncio.shield(self._task)
+
+    def record_login(
+        self,
+        user_id: uuid.UUID,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a login event without awaiting any I/O.
+
+        Returns False if the event was dropped because the writer is not
+        running or the queue is full.
+        """
+        if not self._accepting:
+            self.dropped += 1
+            return False
+
+        event = {
+            "user_id": user_id,
+            "logged_in_at": datetime.utcnow(),
+            "ip_address": ip_address,
+            "user_agent": user_agent[:255] if user_agent else None,
+        }
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+        self.enqueued += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters describing writer throughput and loss."""
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+    async def _run(self) -> None:
+        """Collect events into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            self._in_flight = batch
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            self._in_flight = []
+
+    async def _flush(self, batch: List[Dict]) -> None:
+        """Persist a batch of login events in a single transaction."""
+        last_logins: Dict[uuid.UUID, datetime] = {}
+        for event in batch:
+            previous = last_logins.get(event["user_id"])
+            if previous is None or event["logged_in_at"] > previous:
+                last_logins[event["user_id"]] = event["logged_in_at"]
+
+        try:
+            async with self.session_factory() as session:
+                repository = LoginActivityRepository(session)
+                await repository.insert_login_events(batch)
+                await repository.update_last_login(last_logins)
+                await session.commit()
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("Failed to persist %d login events", len(batch))
+        else:
+            self.written += len(batch)
+
+        if self.dropped > self._dropped_reported:
+            logger.warning(
+                "Login activity queue full; dropped %d events (%d total)",
+                self.dropped - self._dropped_reported,
+                self.dropped,
+            )
+            self._dropped_reported = self.dropped
+
+
+login_activity_writer = LoginActivityWriter()
@@ -2,6 +2,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.usreRepository import UserRepository
 from app.core.security import PasswordUtil, TokenUtil
+from app.services.loginActivityWriter import login_activity_writer
 from app.schemas.user import UserRegisterRequest, UserLoginRequest, TokenResponse
 from app.models.user import User
 from typing import Optional, Tuple
@@ -48,7 +49,12 @@ class UserService:
 
         return user, tokens
 
-    async def login_user(self, request: UserLoginRequest) -> Tuple[User, TokenResponse]:
+    async def login_user(
+        self,
+        request: UserLoginRequest,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> Tuple[User, TokenResponse]:
         """
         Authenticate user and return tokens.
         
@@ -56,7 +62,8 @@ class UserService:
         1. Find user by email
         2. Verify password
         3. Generate access & refresh tokens
-        4. Return user and tokens
+        4. Queue login activity for the background writer
+        5. Return user and tokens
         """
         # Find user by email
         user = await self.repository.get_user_by_email(request.email)
@@ -74,6 +81,9 @@ class UserService:
         # Generate tokens
         tokens = self._generate_tokens(user.id)
 
+        # Record login; persisted in batches off the request path
+        login_activity_writer.record_login(user.id, ip_address, user_agent)
+
         return user, tokens
 
     async def get_user_details(self, user_id: int) -> Optional[User]:
@@ -0,0 +1,195 @@
+"""
+Benchmark per-request CPU of the API in default vs fast JSON mode.
+
+Each mode runs in its own subprocess with FAST_JSON_RESPONSES set before
+the app is imported, so the default response class really differs between
+modes. Modes alternate over several rounds and the report gives medians
+and the spread of the per-round difference.
+
+Password hashing and the database are stubbed out so the numbers reflect
+only the FastAPI request/response path (body parsing, dependency
+resolution, response validation and serialization). The "login response
+build" row times just the step fast mode replaces, turning the
+TokenResponse into a Response, which is less noisy than a full request.
+
+Usage:
+    python -m benchmarks.login_response_bench [--requests 5000] [--rounds 7]
+
+Run it with the FastAPI version you deploy. Newer releases (0.143 does,
+0.127 does not) serialize response_model straight to bytes unless a custom
+default response class is set, which shrinks the login gain and makes
+other endpoints slower.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+LOGIN_BODY = json.dumps({"email": "user@example.com", "password": "SecurePass123"}).encode()
+REPEATS = 5
+ENDPOINTS = {
+    "POST /auth/login": ("POST", "/auth/login", LOGIN_BODY),
+    "GET /health": ("GET", "/health", b""),
+}
+
+
+async def _call(app, method: str, path: str, body: bytes) -> bytes:
+    """Drive one request through the ASGI app and return the response body."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"user-agent", b"bench"),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+    received = False
+    chunks = []
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def _time(case, requests: int) -> float:
+    """Return best-of-REPEATS mean CPU microseconds per call of case()."""
+    async def call():
+        result = case()
+        if asyncio.iscoroutine(result):
+            await result
+
+    for _ in range(min(requests // 10, 1000)):
+        await call()
+    # Best of several repeats, as timeit does, to shed scheduler noise
+    timings = []
+    per_repeat = requests // REPEATS
+    for _ in range(REPEATS):
+        start = time.process_time()
+        for _ in range(per_repeat):
+            await call()
+        timings.append((time.process_time() - start) / per_repeat)
+    return min(timings) * 1e6
+
+
+async def _worker(requests: int) -> dict:
+    """Measure every endpoint in the mode chosen by the environment."""
+    from fastapi.responses import JSONResponse
+    from app.core.config import settings
+    from app.core.responses import json_response
+    from app.db.database import get_db
+    from app.main import app
+    from app.schemas.user import TokenResponse, token_response_adapter
+    from app.services.userService import UserService
+
+    # Fixed tokens so payloads can be compared across processes
+    tokens = TokenResponse(
+        access_token="header.access.signature",
+        refresh_token="header.refresh.signature",
+        token_type="bearer",
+        expires_in=900,
+    )
+
+    async def fake_login_user(self, request, ip_address=None, user_agent=None):
+        return None, tokens
+
+    async def fake_db():
+        yield None
+
+    UserService.login_user = fake_login_user
+    app.dependency_overrides[get_db] = fake_db
+
+    def default_build():
+        # Core of FastAPI's response_model path: validate, dump, json.dumps.
+        # FastAPI 0.127 also runs jsonable_encoder, so this understates it.
+        adapter = token_response_adapter
+        return JSONResponse(adapter.dump_python(adapter.validate_python(tokens), mode="json"))
+
+    def fast_build():
+        return json_response(token_response_adapter, tokens)
+
+    build = fast_build if settings.fast_json_responses else default_build
+    cases = {name: (lambda args=args: _call(app, *args)) for name, args in ENDPOINTS.items()}
+    cases["login response build"] = build
+
+    result = {"login_body": (await _call(app, *ENDPOINTS["POST /auth/login"])).decode()}
+    for name, case in cases.items():
+        result[name] = await _time(case, requests)
+    return result
+
+
+def _run_mode(fast: bool, requests: int) -> dict:
+    """Run one measurement in a fresh interpreter for the given mode."""
+    env = dict(os.environ, FAST_JSON_RESPONSES="true" if fast else "false")
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.login_response_bench", "--worker",
+         "--requests", str(requests)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(requests: int, rounds: int) -> None:
+    """Alternate modes over several rounds and print the CPU saved."""
+    samples = {False: [], True: []}
+    for i in range(rounds):
+        order = (False, True) if i % 2 == 0 else (True, False)
+        for fast in order:
+            samples[fast].append(_run_mode(fast, requests))
+
+    default_body = json.loads(samples[False][0]["login_body"])
+    fast_body = json.loads(samples[True][0]["login_body"])
+    assert default_body == fast_body, "fast mode changed the /auth/login payload"
+
+    print(f"{rounds} rounds x {requests} requests per mode, CPU us/request")
+    print(f"{'case':<22} {'default':>9} {'fast':>9} {'saved (median, min..max)':>32}")
+    for name in [*ENDPOINTS, "login response build"]:
+        default_us = [s[name] for s in samples[False]]
+        fast_us = [s[name] for s in samples[True]]
+        saved = [d - f for d, f in zip(default_us, fast_us)]
+        median_default = statistics.median(default_us)
+        median_saved = statistics.median(saved)
+        print(
+            f"{name:<22} {median_default:9.1f} {statistics.median(fast_us):9.1f} "
+            f"{median_saved:9.1f} ({median_saved / median_default:5.1%}) "
+            f"{min(saved):7.1f}..{max(saved):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        print(json.dumps(asyncio.run(_worker(args.requests))))
+    else:
+        main(args.requests, args.rounds)
@@ -0,0 +1,37 @@
+"""Add last_login_at to users and create login_activity table
+
+Revision ID: 002_login_activity
+Revises: 001_initial
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002_login_activity'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('last_login_at', sa.DateTime(), nullable=True))
+    op.create_table(
+        'login_activity',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('logged_in_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('ip_address', sa.String(45), nullable=True),
+        sa.Column('user_agent', sa.String(255), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_login_activity_user_id'), 'login_activity', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_login_activity_user_id'), table_name='login_activity')
+    op.drop_table('login_activity')
+    op.drop_column('users', 'last_login_at')
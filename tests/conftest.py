@@ -0,0 +1,6 @@
+"""Pytest configuration."""
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
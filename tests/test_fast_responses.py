@@ -0,0 +1,75 @@
+"""Tests that fast JSON mode returns the same responses as the default mode."""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.db.database import get_db
+from app.main import app
+from app.schemas.user import TokenResponse
+from app.services.userService import UserService
+
+TOKENS = TokenResponse(
+    access_token="header.access.signature",
+    refresh_token="header.refresh.signature",
+    token_type="bearer",
+    expires_in=900,
+)
+USER = SimpleNamespace(
+    id=uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
+    email="user@example.com",
+    username="john_doe",
+    is_active=True,
+    created_at=datetime(2024, 1, 15, 10, 30),
+)
+
+REQUESTS = {
+    "login": ("post", "/auth/login", {"email": "user@example.com", "password": "SecurePass123"}),
+    "register": (
+        "post",
+        "/auth/register",
+        {"email": "user@example.com", "username": "john_doe", "password": "SecurePass123"},
+    ),
+    "get_user": ("get", "/auth/users/1", None),
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fake_db():
+        yield None
+
+    async def register_user(self, request):
+        return USER, TOKENS
+
+    async def login_user(self, request, ip_address=None, user_agent=None):
+        return USER, TOKENS
+
+    async def get_user_details(self, user_id):
+        return USER
+
+    monkeypatch.setattr(UserService, "register_user", register_user)
+    monkeypatch.setattr(UserService, "login_user", login_user)
+    monkeypatch.setattr(UserService, "get_user_details", get_user_details)
+    app.dependency_overrides[get_db] = fake_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db)
+
+
+def fetch(client, monkeypatch, name: str, fast: bool):
+    monkeypatch.setattr(settings, "fast_json_responses", fast)
+    method, path, body = REQUESTS[name]
+    response = getattr(client, method)(path, json=body) if body else getattr(client, method)(path)
+    return response.status_code, response.headers["content-type"], response.json()
+
+
+@pytest.mark.parametrize("name", sorted(REQUESTS))
+def test_fast_mode_matches_default(client, monkeypatch, name):
+    assert fetch(client, monkeypatch, name, fast=True) == fetch(client, monkeypatch, name, fast=False)
+
+
+def test_register_stays_created_in_fast_mode(client, monkeypatch):
+    status_code, _, body = fetch(client, monkeypatch, "register", fast=True)
+    assert status_code == 201
+    assert body == TOKENS.model_dump()
@@ -0,0 +1,164 @@
+"""Tests for the write-behind login activity writer."""
+import asyncio
+import uuid
+import pytest
+import app.services.loginActivityWriter as writer_module
+from app.services.loginActivityWriter import LoginActivityWriter
+
+
+class FakeStore:
+    """Collects what fake sessions commit."""
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.flushes = []
+        self.last_logins = []
+
+
+class FakeSession:
+    """Async session stand-in that commits into a FakeStore."""
+
+    def __init__(self, store: FakeStore):
+        self.store = store
+        self.events = []
+        self.last_logins = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        if self.store.hang:
+            await asyncio.Event().wait()
+        self.store.flushes.append(self.events)
+        self.store.last_logins.append(self.last_logins)
+
+
+class FakeRepository:
+    """Records repository calls on the fake session."""
+
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+    async def insert_login_events(self, events):
+        self.session.events = list(events)
+
+    async def update_last_login(self, last_logins):
+        self.session.last_logins = dict(last_logins)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setattr(writer_module, "LoginActivityRepository", FakeRepository)
+    return FakeStore()
+
+
+def make_writer(store: FakeStore, **kwargs) -> LoginActivityWriter:
+    options = {
+        "max_queue_size": 100,
+        "batch_size": 100,
+        "flush_interval": 60.0,
+        "shutdown_timeout": 5.0,
+    }
+    options.update(kwargs)
+    return LoginActivityWriter(session_factory=lambda: FakeSession(store), **options)
+
+
+async def wait_for_flushes(store: FakeStore, count: int) -> None:
+    for _ in range(200):
+        if len(store.flushes) >= count:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"expected {count} flushes, got {len(store.flushes)}")
+
+
+async def test_flushes_when_batch_size_reached(store):
+    writer = make_writer(store, batch_size=3)
+    await writer.start()
+    for _ in range(3):
+        assert writer.record_login(uuid.uuid4())
+
+    await wait_for_flushes(store, 1)
+    assert [len(batch) for batch in store.flushes] == [3]
+    assert writer.written == 3
+    await writer.stop()
+
+
+async def test_flushes_when_interval_elapses(store):
+    writer = make_writer(store, flush_interval=0.05)
+    await writer.start()
+    writer.record_login(uuid.uuid4())
+    writer.record_login(uuid.uuid4())
+
+    await wait_for_flushes(store, 1)
+    assert [len(batch) for batch in store.flushes] == [2]
+    await writer.stop()
+
+
+async def test_drops_when_queue_full(store):
+    writer = make_writer(store, max_queue_size=2)
+    await writer.start()
+    # No await between calls, so the worker cannot drain the queue
+    results = [writer.record_login(uuid.uuid4()) for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert writer.dropped == 3
+    assert writer.enqueued == 2
+    await writer.stop()
+    assert writer.written == 2
+
+
+async def test_drops_when_not_running(store):
+    writer = make_writer(store)
+    assert writer.record_login(uuid.uuid4()) is False
+
+    await writer.start()
+    await writer.stop()
+    assert writer.record_login(uuid.uuid4()) is False
+    assert writer.dropped == 2
+    assert store.flushes == []
+
+
+async def test_stop_drains_queued_events(store):
+    writer = make_writer(store)
+    await writer.start()
+    for _ in range(5):
+        writer.record_login(uuid.uuid4())
+
+    await writer.stop()
+    assert sum(len(batch) for batch in store.flushes) == 5
+    assert writer.stats()["written"] == 5
+
+
+async def test_last_login_keeps_latest_timestamp_per_user(store):
+    writer = make_writer(store)
+    await writer.start()
+    alice, bob = uuid.uuid4(), uuid.uuid4()
+    for user_id in (alice, bob, alice, alice):
+        writer.record_login(user_id)
+        await asyncio.sleep(0.001)
+
+    await writer.stop()
+    [events] = store.flushes
+    [last_logins] = store.last_logins
+    assert last_logins == {
+        alice: max(e["logged_in_at"] for e in events if e["user_id"] == alice),
+        bob: max(e["logged_in_at"] for e in events if e["user_id"] == bob),
+    }
+    assert last_logins[alice] == events[-1]["logged_in_at"]
+
+
+async def test_stop_gives_up_after_timeout(store):
+    store.hang = True
+    writer = make_writer(store, max_queue_size=3, batch_size=1, shutdown_timeout=0.2)
+    await writer.start()
+    writer.record_login(uuid.uuid4())
+    await asyncio.sleep(0.05)  # worker is now stuck flushing the first event
+    for _ in range(3):
+        assert writer.record_login(uuid.uuid4())
+
+    await asyncio.wait_for(writer.stop(), timeout=2)
+    assert writer.failed == 4
+    assert writer.written == 0